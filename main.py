@@ -6,10 +6,22 @@ Main entry point for the modular architecture
 
 import os
 import sys
+import signal
+import socket
 import asyncio
 import logging
 from typing import Optional
 
+# Faster event loop: uvloop on POSIX, winloop on Windows
+try:
+    if sys.platform == "win32":
+        import winloop as uvloop
+    else:
+        import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add modules to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'modules'))
 
@@ -30,6 +42,7 @@ class ModularPowerBIApp:
     def __init__(self, config_file: Optional[str] = None):
         # Load configuration
         self.config = get_config_manager(config_file)
+        logging.getLogger().setLevel(self.config.logging.level.upper())
         
         # Validate critical configuration
         validation = self.config.validate()
@@ -68,7 +81,8 @@ class ModularPowerBIApp:
                     mcp_api_key=self.config.mcp.api_key,
                     host=self.config.web.host,
                     port=self.config.web.port,
-                    config_manager=self.config
+                    config_manager=self.config,
+                    reuse_port=self.config.web.workers > 1 and hasattr(socket, "SO_REUSEPORT")
                 )
                 logger.info("✅ Web server initialized")
                 
@@ -122,11 +136,11 @@ class ModularPowerBIApp:
                 print("\n🛑 Press Ctrl+C to stop all services")
                 print("="*60)
                 
-                # Keep the application running
+                # Keep the application running until a shutdown signal arrives
+                stop_event = asyncio.Event()
+                self._install_signal_handlers(stop_event)
                 try:
-                    while True:
-                        await asyncio.sleep(1)
-                except KeyboardInterrupt:
+                    await stop_event.wait()
                     logger.info("🛑 Shutdown requested...")
                 finally:
                     await self.cleanup(runner)
@@ -138,6 +152,16 @@ class ModularPowerBIApp:
             logger.error("❌ No services configured to start")
             sys.exit(1)
     
+    def _install_signal_handlers(self, stop_event: asyncio.Event):
+        """Set the stop event on SIGINT/SIGTERM instead of polling for shutdown"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                # Windows: Ctrl+C cancels the main task and cleanup runs in finally
+                pass
+    
     async def cleanup(self, runner=None):
         """Cleanup application resources"""
         logger.info("🔄 Cleaning up application resources...")
@@ -185,7 +209,8 @@ def create_sample_config():
         "web": {
             "host": "0.0.0.0",
             "port": 8080,
-            "enable_cors": True
+            "enable_cors": True,
+            "workers": 1
         },
         "logging": {
             "level": "INFO",
@@ -206,7 +231,61 @@ def create_sample_config():
         print(f"❌ Failed to create sample config: {e}")
         return None
 
-async def main():
+async def run_app(config_file: Optional[str] = None):
+    """Run the application in the current process"""
+    try:
+        app = ModularPowerBIApp(config_file)
+        await app.start()
+    except KeyboardInterrupt:
+        logger.info("Application interrupted by user")
+    except Exception as e:
+        logger.error(f"Application failed: {e}", exc_info=True)
+        sys.exit(1)
+
+def run_workers(config_file: Optional[str], workers: int):
+    """Fork worker processes that share the listening port via SO_REUSEPORT"""
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                asyncio.run(run_app(config_file))
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+            except KeyboardInterrupt:
+                pass
+            os._exit(exit_code)
+        children.append(pid)
+    
+    logger.info(f"Started {workers} web workers: {children}")
+    
+    forwarded = set()
+    
+    def _forward_signal(signum, frame):
+        forwarded.add(signum)
+        for pid in children:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGINT, _forward_signal)
+    signal.signal(signal.SIGTERM, _forward_signal)
+    
+    failed = {}
+    for pid in children:
+        _, status = os.waitpid(pid, 0)
+        exit_code = os.waitstatus_to_exitcode(status)
+        # A worker killed by a signal we forwarded shut down as asked
+        if exit_code != 0 and -exit_code not in forwarded:
+            failed[pid] = exit_code
+    
+    if failed:
+        logger.error(f"Web workers exited with errors (pid: exit code): {failed}")
+        sys.exit(1)
+
+def main():
     """Main entry point"""
     import argparse
     
@@ -223,20 +302,19 @@ async def main():
         return
     
     # Validate configuration if requested
+    config = get_config_manager(args.config)
     if args.validate_config:
-        config = get_config_manager(args.config)
         config.print_configuration_status()
         return
     
-    # Start the application
-    try:
-        app = ModularPowerBIApp(args.config)
-        await app.start()
-    except KeyboardInterrupt:
-        logger.info("Application interrupted by user")
-    except Exception as e:
-        logger.error(f"Application failed: {e}", exc_info=True)
-        sys.exit(1)
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    
+    # Start the application, forking workers when several are configured
+    if config.web.workers > 1 and hasattr(socket, "SO_REUSEPORT"):
+        run_workers(args.config, config.web.workers)
+    else:
+        asyncio.run(run_app(args.config))
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
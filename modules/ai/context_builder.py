@@ -4,6 +4,7 @@ Builds comprehensive context for intelligent Power BI analysis
 """
 
 import logging
+from collections import deque
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
@@ -65,7 +66,7 @@ class PowerBIContextBuilder:
     
     def __init__(self, powerbi_client: PowerBIClient):
         self.powerbi_client = powerbi_client
-        self._query_history = []
+        self._query_history = deque(maxlen=10)
         self._user_preferences = {}
         
     async def build_context(self, user_query: str) -> PowerBIContext:
@@ -185,7 +186,7 @@ class PowerBIContextBuilder:
         # Sort by relevance and limit to top 5
         context.relevant_datasets = sorted(
             relevant_datasets, 
-            key=lambda ds: getattr(ds, 'relevance_score', 0), 
+            key=lambda ds: ds.relevance_score, 
             reverse=True
         )[:5]
     
@@ -331,19 +332,15 @@ class PowerBIContextBuilder:
     
     def _build_historical_context(self, context: PowerBIContext):
         """Build historical query context"""
-        # Add current query to history
+        # Add current query to history (bounded to the last 10 queries)
         self._query_history.append({
             "query": context.query,
             "intent": context.intent,
             "timestamp": datetime.now()
         })
         
-        # Keep only last 10 queries
-        if len(self._query_history) > 10:
-            self._query_history = self._query_history[-10:]
-        
         # Extract recent query patterns
-        context.recent_queries = [q["query"] for q in self._query_history[-5:]]
+        context.recent_queries = [q["query"] for q in self._query_history][-5:]
         
         # Build query pattern analysis
         intent_counts = {}
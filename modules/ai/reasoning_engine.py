@@ -267,19 +267,19 @@ class PowerBIReasoningEngine:
             "execution_summary": []
         }
         
-        # Execute DAX queries from thinking process
-        for i, dax_query in enumerate(thinking.dax_queries):
-            if context.relevant_datasets:
-                dataset = context.relevant_datasets[0]  # Use primary dataset
-                
-                logger.debug(f"Executing query {i+1}/{len(thinking.dax_queries)}...")
-                
-                query_result = await self.powerbi_client.execute_dax_query(
-                    dataset_id=dataset.id,
-                    dax_query=dax_query,
-                    context=context
-                )
-                
+        # Execute DAX queries from thinking process concurrently
+        if thinking.dax_queries and context.relevant_datasets:
+            dataset = context.relevant_datasets[0]  # Use primary dataset
+            
+            logger.debug(f"Executing {len(thinking.dax_queries)} queries...")
+            
+            query_results = await self.powerbi_client.execute_dax_queries(
+                dataset_id=dataset.id,
+                dax_queries=thinking.dax_queries,
+                context=context
+            )
+            
+            for i, query_result in enumerate(query_results):
                 results["query_results"].append(query_result)
                 
                 if query_result.success and query_result.data:
@@ -4,9 +4,10 @@ Handles OAuth2 authentication with Power BI services
 """
 
 import os
+import time
+import asyncio
 import logging
 from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 try:
@@ -18,6 +19,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Refresh tokens this long before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
 @dataclass
 class PowerBICredentials:
     """Power BI authentication credentials"""
@@ -45,8 +49,21 @@ class PowerBIAuthManager:
             authority_url=f"https://login.microsoftonline.com/{tenant_id}"
         )
         
+        # Credentials are immutable after construction, so evaluate presence once
+        self._credentials_present = {
+            "tenant_id": bool(tenant_id),
+            "client_id": bool(client_id),
+            "client_secret": bool(client_secret)
+        }
+        self._creds_present = all(self._credentials_present.values())
+        
         self._msal_app = None
         self._token_cache = {}
+        self._token_lock = asyncio.Lock()
+        
+        # Bumped whenever a token is acquired or acquisition fails, so data cached
+        # under the previous token (e.g. the client's workspace list) can be invalidated
+        self.token_generation = 0
         self._initialize_msal_client()
     
     def _initialize_msal_client(self):
@@ -59,7 +76,7 @@ class PowerBIAuthManager:
             )
             logger.info("Power BI MSAL client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize MSAL client: {e}")
+            logger.error("Failed to initialize MSAL client: %s", e)
             raise
     
     async def get_access_token(self) -> Optional[str]:
@@ -68,59 +85,63 @@ class PowerBIAuthManager:
             logger.error("MSAL client not initialized")
             return None
         
-        # Check cache first
-        cache_key = "powerbi_token"
-        if cache_key in self._token_cache:
-            cached_token = self._token_cache[cache_key]
-            if cached_token["expires_at"] > datetime.now() + timedelta(minutes=5):
-                logger.debug("Using cached Power BI access token")
-                return cached_token["access_token"]
+        # Fast path: cached token still valid, no lock or network call
+        access_token = self._get_cached_token()
+        if access_token:
+            return access_token
         
-        try:
-            logger.info("Acquiring new Power BI access token...")
-            result = self._msal_app.acquire_token_for_client(
-                scopes=[self.credentials.scope]
-            )
+        async with self._token_lock:
+            # Another caller may have refreshed the token while we waited
+            access_token = self._get_cached_token()
+            if access_token:
+                return access_token
             
-            if "access_token" in result:
-                # Cache the token
-                expires_in = result.get("expires_in", 3600)
-                self._token_cache[cache_key] = {
-                    "access_token": result["access_token"],
-                    "expires_at": datetime.now() + timedelta(seconds=expires_in)
-                }
+            try:
+                logger.info("Acquiring new Power BI access token...")
+                result = await asyncio.to_thread(
+                    self._msal_app.acquire_token_for_client,
+                    scopes=[self.credentials.scope]
+                )
                 
-                logger.info("Successfully acquired Power BI access token")
-                return result["access_token"]
-            else:
-                error_msg = result.get('error_description', result.get('error', 'Unknown error'))
-                logger.error(f"Failed to acquire token: {error_msg}")
-                return None
+                self.token_generation += 1
                 
-        except Exception as e:
-            logger.error(f"Exception while getting access token: {e}", exc_info=True)
-            return None
+                if "access_token" in result:
+                    # Cache the token
+                    expires_in = result.get("expires_in", 3600)
+                    self._token_cache["powerbi_token"] = {
+                        "access_token": result["access_token"],
+                        "expires_at": time.monotonic() + expires_in
+                    }
+                    
+                    logger.info("Successfully acquired Power BI access token")
+                    return result["access_token"]
+                else:
+                    error_msg = result.get('error_description', result.get('error', 'Unknown error'))
+                    logger.error("Failed to acquire token: %s", error_msg)
+                    return None
+                    
+            except Exception as e:
+                self.token_generation += 1
+                logger.error("Exception while getting access token: %s", e, exc_info=True)
+                return None
+    
+    def _get_cached_token(self) -> Optional[str]:
+        """Return the cached token if it is not about to expire"""
+        cached_token = self._token_cache.get("powerbi_token")
+        if cached_token and time.monotonic() < cached_token["expires_at"] - TOKEN_REFRESH_MARGIN_SECONDS:
+            return cached_token["access_token"]
+        return None
     
     def is_configured(self) -> bool:
         """Check if authentication is properly configured"""
-        return (
-            MSAL_AVAILABLE and
-            self.credentials.tenant_id and 
-            self.credentials.client_id and 
-            self.credentials.client_secret and
-            self._msal_app is not None
-        )
+        return MSAL_AVAILABLE and self._creds_present and self._msal_app is not None
     
     def get_configuration_status(self) -> Dict[str, Any]:
         """Get detailed configuration status"""
         return {
             "configured": self.is_configured(),
             "msal_available": MSAL_AVAILABLE,
-            "credentials_present": {
-                "tenant_id": bool(self.credentials.tenant_id),
-                "client_id": bool(self.credentials.client_id),
-                "client_secret": bool(self.credentials.client_secret)
-            },
+            "credentials_present": dict(self._credentials_present),
             "token_cached": bool(self._token_cache.get("powerbi_token")),
             "authority_url": self.credentials.authority_url
         }
@@ -39,6 +39,7 @@ class TokenManager:
         if refresh_callback:
             self._refresh_callbacks[cache_key] = refresh_callback
         
+        self._start_cleanup_task()
         logger.debug(f"Token stored for key: {cache_key}")
     
     def get_token(self, cache_key: str, min_validity_minutes: int = 5) -> Optional[TokenInfo]:
@@ -117,8 +118,16 @@ class TokenManager:
     
     def _start_cleanup_task(self):
         """Start background task to clean up expired tokens"""
-        if self._cleanup_task is None:
-            self._cleanup_task = asyncio.create_task(self._cleanup_expired_tokens())
+        if self._cleanup_task is not None:
+            return
+        
+        # Created at import time there is no loop yet; store_token() starts it later
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        self._cleanup_task = asyncio.create_task(self._cleanup_expired_tokens())
     
     async def _cleanup_expired_tokens(self):
         """Background task to periodically clean up expired tokens"""
@@ -46,6 +46,7 @@ class WebConfig:
     port: int = 8080
     enable_cors: bool = True
     static_path: Optional[str] = None
+    workers: int = 1
 
 @dataclass
 class LoggingConfig:
@@ -55,7 +56,7 @@ class LoggingConfig:
     log_dir: Optional[str] = None
     enable_file_logging: bool = False
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AzureOpenAIConfig:
     """Azure OpenAI configuration settings"""
     endpoint: str
@@ -191,7 +192,8 @@ class ConfigManager:
             host=os.environ.get("WEB_HOST", self._config_data.get("web", {}).get("host", "0.0.0.0")),
             port=int(os.environ.get("WEB_PORT", self._config_data.get("web", {}).get("port", 8080))),
             enable_cors=os.environ.get("WEB_ENABLE_CORS", str(self._config_data.get("web", {}).get("enable_cors", True))).lower() == "true",
-            static_path=os.environ.get("WEB_STATIC_PATH") or self._config_data.get("web", {}).get("static_path")
+            static_path=os.environ.get("WEB_STATIC_PATH") or self._config_data.get("web", {}).get("static_path"),
+            workers=int(os.environ.get("WEB_WORKERS", self._config_data.get("web", {}).get("workers", 1)))
         )
         logger.info("Web server configuration loaded")
     
@@ -352,7 +354,8 @@ class ConfigManager:
             "web": {
                 "host": self.web.host,
                 "port": self.web.port,
-                "enable_cors": self.web.enable_cors
+                "enable_cors": self.web.enable_cors,
+                "workers": self.web.workers
             },
             
             "logging": {
@@ -3,9 +3,11 @@ Intelligent MCP Tools with AI-Powered Analysis
 Enhanced Power BI MCP tools with Azure OpenAI reasoning capabilities
 """
 
+import copy
 import logging
 import json
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from ..config import ConfigManager
@@ -21,6 +23,10 @@ from ..ai.azure_openai_client import AzureOpenAIConfig
 
 logger = logging.getLogger(__name__)
 
+# Exact-match cache for successful analyses (LRU, entries expire after the TTL)
+ANALYSIS_CACHE_MAX_SIZE = 1024
+ANALYSIS_CACHE_TTL_SECONDS = 300
+
 class IntelligentPowerBIAnalyzer:
     """
     AI-powered Power BI analyzer with reasoning capabilities
@@ -33,6 +39,7 @@ class IntelligentPowerBIAnalyzer:
         self.powerbi_client = None
         self.reasoning_engine = None
         self.response_formatter = None
+        self._analysis_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
         
         self._initialize_components()
     
@@ -94,6 +101,12 @@ class IntelligentPowerBIAnalyzer:
                 "message": "Please configure Azure OpenAI settings to enable intelligent analysis"
             }
         
+        cache_key = (" ".join(user_question.lower().split()), analysis_depth)
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            logger.debug("Using cached analysis result")
+            return cached
+        
         try:
             logger.info(f"Starting intelligent analysis: {user_question[:50]}...")
             
@@ -121,13 +134,16 @@ class IntelligentPowerBIAnalyzer:
                 "metadata": {
                     "analysis_type": "intelligent_ai_powered",
                     "timestamp": datetime.now().isoformat(),
-                    "ai_enabled": True
+                    "ai_enabled": True,
+                    "cached": False
                 }
             }
             
             if not result.success:
                 response_data["error"] = result.error_message
                 response_data["warnings"] = result.warnings
+            else:
+                self._cache_analysis(cache_key, response_data)
             
             logger.info(f"Intelligent analysis completed: {result.success}")
             return response_data
@@ -141,6 +157,34 @@ class IntelligentPowerBIAnalyzer:
                 "timestamp": datetime.now().isoformat()
             }
     
+    def _get_cached_analysis(self, cache_key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of a fresh cached analysis (marked cached), or None"""
+        cached_data = self._analysis_cache.get(cache_key)
+        if cached_data is None:
+            return None
+        
+        if (datetime.now() - cached_data["timestamp"]).total_seconds() >= ANALYSIS_CACHE_TTL_SECONDS:
+            del self._analysis_cache[cache_key]
+            return None
+        
+        self._analysis_cache.move_to_end(cache_key)
+        
+        # Deep copy so callers can't mutate the cached entry; metadata.timestamp
+        # stays the time the analysis ran
+        response_data = copy.deepcopy(cached_data["data"])
+        response_data["metadata"]["cached"] = True
+        return response_data
+    
+    def _cache_analysis(self, cache_key: Tuple[str, str], response_data: Dict[str, Any]):
+        """Store a successful analysis, evicting the least recently used entry"""
+        self._analysis_cache[cache_key] = {
+            "data": copy.deepcopy(response_data),
+            "timestamp": datetime.now()
+        }
+        self._analysis_cache.move_to_end(cache_key)
+        if len(self._analysis_cache) > ANALYSIS_CACHE_MAX_SIZE:
+            self._analysis_cache.popitem(last=False)
+    
     async def smart_dax_generation(self, natural_language_request: str, dataset_context: str = "auto") -> Dict[str, Any]:
         """
         Generate smart DAX queries with business context
@@ -232,6 +276,11 @@ class IntelligentPowerBIAnalyzer:
             },
             "statistics": self.reasoning_engine.get_statistics() if self.reasoning_engine else {}
         }
+    
+    async def close(self):
+        """Release Power BI client resources"""
+        if self.powerbi_client:
+            await self.powerbi_client.close()
 
 def create_intelligent_mcp_tools(config_manager: ConfigManager) -> List[Dict[str, Any]]:
     """
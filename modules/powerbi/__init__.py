@@ -3,14 +3,10 @@ Power BI integration module
 """
 
 from .client import PowerBIClient
-from .workspace_manager import WorkspaceManager
-from .query_engine import QueryEngine
 from .models import WorkspaceInfo, DatasetInfo, QueryResult
 
 __all__ = [
     'PowerBIClient',
-    'WorkspaceManager', 
-    'QueryEngine',
     'WorkspaceInfo',
     'DatasetInfo',
     'QueryResult'
@@ -3,33 +3,137 @@ Modular Power BI Client
 Handles Power BI API interactions with improved error handling and caching
 """
 
+import time
+import asyncio
 import logging
 import hashlib
+import random
+from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 import aiohttp
+import orjson
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
 
 from ..auth import PowerBIAuthManager
 from .models import WorkspaceInfo, DatasetInfo, QueryResult, PowerBIContext
 
 logger = logging.getLogger(__name__)
 
+# Throttling / transient statuses that are retried with backoff
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+MAX_RETRIES = 3
+MAX_RETRY_DELAY_SECONDS = 30
+
+# Chunk size used when streaming executeQueries responses
+STREAM_CHUNK_SIZE = 65536
+
+# Upper bound on how much of an error response body is read
+ERROR_BODY_LIMIT = 4096
+
+# Maximum age of cached workspaces reused by connection validation (health probes)
+VALIDATION_CACHE_SECONDS = 60
+
 class PowerBIClient:
     """Modular Power BI API client"""
     
+    __slots__ = (
+        "auth_manager",
+        "base_url",
+        "_workspace_cache",
+        "_dataset_cache",
+        "_session"
+    )
+    
     def __init__(self, auth_manager: PowerBIAuthManager):
         self.auth_manager = auth_manager
         self.base_url = "https://api.powerbi.com/v1.0/myorg"
         self._workspace_cache = {}
         self._dataset_cache = {}
+        self._session: Optional[aiohttp.ClientSession] = None
     
-    async def get_workspaces(self, force_refresh: bool = False) -> List[WorkspaceInfo]:
-        """Get list of accessible workspaces"""
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+        return self._session
+    
+    @asynccontextmanager
+    async def _request_with_retry(self,
+                                  session: aiohttp.ClientSession,
+                                  method: str,
+                                  url: str,
+                                  **kwargs):
+        """Issue a request, retrying throttled/transient responses with jittered backoff"""
+        for attempt in range(MAX_RETRIES + 1):
+            response = await session.request(method, url, **kwargs)
+            
+            if response.status not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                break
+            
+            delay = self._get_retry_delay(response, attempt)
+            response.release()
+            
+            logger.warning(
+                "%s %s returned %s, retrying in %.1fs (attempt %d/%d)",
+                method, url, response.status, delay, attempt + 1, MAX_RETRIES
+            )
+            await asyncio.sleep(delay)
+        
+        try:
+            yield response
+        finally:
+            response.release()
+    
+    @staticmethod
+    def _get_retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Delay before the next retry, honouring Retry-After when present"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_RETRY_DELAY_SECONDS)
+            except ValueError:
+                pass
+        
+        return random.uniform(0, 2 ** attempt)
+    
+    @staticmethod
+    async def _read_error_text(response: aiohttp.ClientResponse) -> str:
+        """Read at most ERROR_BODY_LIMIT bytes of an error response body"""
+        raw = bytearray()
+        
+        # read(n) returns whatever has arrived (up to n), so keep reading until EOF or the limit
+        while len(raw) < ERROR_BODY_LIMIT:
+            chunk = await response.content.read(ERROR_BODY_LIMIT - len(raw))
+            if not chunk:
+                break
+            raw += chunk
+        
+        return raw.decode("utf-8", errors="replace")
+    
+    async def get_workspaces(self, force_refresh: bool = False, max_age: int = 600) -> List[WorkspaceInfo]:
+        """Get list of accessible workspaces (cached for max_age seconds, and per access token)"""
         if not force_refresh and "workspaces" in self._workspace_cache:
             cached_data = self._workspace_cache["workspaces"]
-            # Cache for 10 minutes
-            if (datetime.now() - cached_data["timestamp"]).seconds < 600:
+            if (cached_data["token_generation"] == self.auth_manager.token_generation
+                    and (datetime.now() - cached_data["timestamp"]).total_seconds() < max_age):
                 logger.debug("Using cached workspace data")
                 return cached_data["data"]
         
@@ -37,6 +141,7 @@ class PowerBIClient:
         if not access_token:
             logger.error("No access token available for workspace listing")
             return []
+        token_generation = self.auth_manager.token_generation
         
         try:
             headers = {
@@ -44,49 +149,52 @@ class PowerBIClient:
                 "Content-Type": "application/json"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/groups",
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
+            session = await self._get_session()
+            async with self._request_with_retry(
+                session,
+                "GET",
+                f"{self.base_url}/groups",
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    workspaces = []
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        workspaces = []
-                        
-                        for ws in data.get("value", []):
-                            workspace = WorkspaceInfo(
-                                id=ws["id"],
-                                name=ws["name"],
-                                description=ws.get("description"),
-                                is_personal=ws.get("isPersonal", False),
-                                capacity_id=ws.get("capacityId"),
-                                type=ws.get("type", "Workspace"),
-                                state=ws.get("state", "Active"),
-                                is_read_only=ws.get("isReadOnly", False),
-                                is_on_dedicated_capacity=ws.get("isOnDedicatedCapacity", False)
-                            )
-                            
-                            if workspace.state == "Active":
-                                workspaces.append(workspace)
-                        
-                        # Cache the results
-                        self._workspace_cache["workspaces"] = {
-                            "data": workspaces,
-                            "timestamp": datetime.now()
-                        }
+                    for ws in data.get("value", []):
+                        workspace = WorkspaceInfo(
+                            id=ws["id"],
+                            name=ws["name"],
+                            description=ws.get("description"),
+                            is_personal=ws.get("isPersonal", False),
+                            capacity_id=ws.get("capacityId"),
+                            type=ws.get("type", "Workspace"),
+                            state=ws.get("state", "Active"),
+                            is_read_only=ws.get("isReadOnly", False),
+                            is_on_dedicated_capacity=ws.get("isOnDedicatedCapacity", False)
+                        )
                         
-                        logger.info(f"Retrieved {len(workspaces)} active workspaces")
-                        return workspaces
+                        if workspace.state == "Active":
+                            workspaces.append(workspace)
+                    
+                    # Cache the results
+                    self._workspace_cache["workspaces"] = {
+                        "data": workspaces,
+                        "timestamp": datetime.now(),
+                        "token_generation": token_generation
+                    }
+                    
+                    logger.info("Retrieved %d active workspaces", len(workspaces))
+                    return workspaces
+                
+                else:
+                    error_text = await self._read_error_text(response)
+                    logger.error("Failed to get workspaces: %s - %s", response.status, error_text)
+                    return []
                     
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get workspaces: {response.status} - {error_text}")
-                        return []
-                        
         except Exception as e:
-            logger.error(f"Error fetching workspaces: {e}", exc_info=True)
+            logger.error("Error fetching workspaces: %s", e, exc_info=True)
             return []
     
     async def get_workspace_by_name(self, workspace_name: str) -> Optional[WorkspaceInfo]:
@@ -97,7 +205,7 @@ class PowerBIClient:
             if workspace.name.lower() == workspace_name.lower():
                 return workspace
         
-        logger.warning(f"Workspace '{workspace_name}' not found")
+        logger.warning("Workspace '%s' not found", workspace_name)
         return None
     
     async def get_datasets(self, workspace_id: str, force_refresh: bool = False) -> List[DatasetInfo]:
@@ -107,8 +215,8 @@ class PowerBIClient:
         if not force_refresh and cache_key in self._dataset_cache:
             cached_data = self._dataset_cache[cache_key]
             # Cache for 5 minutes
-            if (datetime.now() - cached_data["timestamp"]).seconds < 300:
-                logger.debug(f"Using cached dataset data for workspace {workspace_id}")
+            if (datetime.now() - cached_data["timestamp"]).total_seconds() < 300:
+                logger.debug("Using cached dataset data for workspace %s", workspace_id)
                 return cached_data["data"]
         
         access_token = await self.auth_manager.get_access_token()
@@ -116,6 +224,8 @@ class PowerBIClient:
             logger.error("No access token available for dataset listing")
             return []
         
+        workspace_name_task = None
+        
         try:
             headers = {
                 "Authorization": f"Bearer {access_token}",
@@ -128,56 +238,67 @@ class PowerBIClient:
                 workspace_name = "My Workspace"
             else:
                 url = f"{self.base_url}/groups/{workspace_id}/datasets"
-                # Get workspace name for context
-                workspaces = await self.get_workspaces()
-                workspace_name = next(
-                    (ws.name for ws in workspaces if ws.id == workspace_id),
-                    "Unknown Workspace"
-                )
+                # Look up workspace name for context while the datasets request is in flight
+                workspace_name_task = asyncio.create_task(self._get_workspace_name(workspace_id))
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
+            session = await self._get_session()
+            async with self._request_with_retry(
+                session,
+                "GET",
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if workspace_name_task:
+                        workspace_name = await workspace_name_task
+                    datasets = []
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        datasets = []
-                        
-                        for ds in data.get("value", []):
-                            dataset = DatasetInfo(
-                                id=ds["id"],
-                                name=ds["name"],
-                                workspace_id=workspace_id,
-                                workspace_name=workspace_name,
-                                configured_by=ds.get("configuredBy"),
-                                created_date=ds.get("createdDate"),
-                                content_provider_type=ds.get("contentProviderType"),
-                                is_refreshable=ds.get("isRefreshable", True),
-                                is_effective_identity_required=ds.get("isEffectiveIdentityRequired", False),
-                                is_effective_identity_roles_required=ds.get("isEffectiveIdentityRolesRequired", False)
-                            )
-                            datasets.append(dataset)
-                        
-                        # Cache the results
-                        self._dataset_cache[cache_key] = {
-                            "data": datasets,
-                            "timestamp": datetime.now()
-                        }
-                        
-                        logger.info(f"Retrieved {len(datasets)} datasets from workspace {workspace_name}")
-                        return datasets
+                    for ds in data.get("value", []):
+                        dataset = DatasetInfo(
+                            id=ds["id"],
+                            name=ds["name"],
+                            workspace_id=workspace_id,
+                            workspace_name=workspace_name,
+                            configured_by=ds.get("configuredBy"),
+                            created_date=ds.get("createdDate"),
+                            content_provider_type=ds.get("contentProviderType"),
+                            is_refreshable=ds.get("isRefreshable", True),
+                            is_effective_identity_required=ds.get("isEffectiveIdentityRequired", False),
+                            is_effective_identity_roles_required=ds.get("isEffectiveIdentityRolesRequired", False)
+                        )
+                        datasets.append(dataset)
+                    
+                    # Cache the results
+                    self._dataset_cache[cache_key] = {
+                        "data": datasets,
+                        "timestamp": datetime.now()
+                    }
+                    
+                    logger.info("Retrieved %d datasets from workspace %s", len(datasets), workspace_name)
+                    return datasets
+                
+                else:
+                    error_text = await self._read_error_text(response)
+                    logger.error("Failed to get datasets: %s - %s", response.status, error_text)
+                    return []
                     
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get datasets: {response.status} - {error_text}")
-                        return []
-                        
         except Exception as e:
-            logger.error(f"Error fetching datasets for workspace {workspace_id}: {e}", exc_info=True)
+            logger.error("Error fetching datasets for workspace %s: %s", workspace_id, e, exc_info=True)
             return []
+        finally:
+            if workspace_name_task and not workspace_name_task.done():
+                workspace_name_task.cancel()
+    
+    async def _get_workspace_name(self, workspace_id: str) -> str:
+        """Resolve a workspace name from the (cached) workspace listing"""
+        workspaces = await self.get_workspaces()
+        return next(
+            (ws.name for ws in workspaces if ws.id == workspace_id),
+            "Unknown Workspace"
+        )
     
     async def get_dataset_by_name(self, workspace_id: str, dataset_name: str) -> Optional[DatasetInfo]:
         """Find dataset by name in a workspace"""
@@ -187,7 +308,7 @@ class PowerBIClient:
             if dataset.name.lower() == dataset_name.lower():
                 return dataset
         
-        logger.warning(f"Dataset '{dataset_name}' not found in workspace {workspace_id}")
+        logger.warning("Dataset '%s' not found in workspace %s", dataset_name, workspace_id)
         return None
     
     async def execute_dax_query(self, 
@@ -195,7 +316,31 @@ class PowerBIClient:
                                dax_query: str,
                                context: Optional[PowerBIContext] = None) -> QueryResult:
         """Execute DAX query against a dataset"""
-        start_time = datetime.now()
+        return await self._execute_query(dataset_id, dax_query, context)
+    
+    async def execute_dax_queries(self,
+                                 dataset_id: str,
+                                 dax_queries: List[str],
+                                 context: Optional[PowerBIContext] = None) -> List[QueryResult]:
+        """Execute several DAX queries against a dataset as concurrent requests"""
+        return await self._execute_queries(dataset_id, dax_queries, [context] * len(dax_queries))
+    
+    async def _execute_queries(self,
+                               dataset_id: str,
+                               dax_queries: List[str],
+                               contexts: List[Optional[PowerBIContext]]) -> List[QueryResult]:
+        """Execute queries concurrently; executeQueries accepts one query per request"""
+        return list(await asyncio.gather(*(
+            self._execute_query(dataset_id, dax_query, context)
+            for dax_query, context in zip(dax_queries, contexts)
+        )))
+    
+    async def _execute_query(self,
+                             dataset_id: str,
+                             dax_query: str,
+                             context: Optional[PowerBIContext] = None) -> QueryResult:
+        """Execute one DAX query in a single executeQueries request"""
+        start_ns = time.monotonic_ns()
         
         # Generate query hash for caching/logging
         query_hash = hashlib.md5(f"{dataset_id}:{dax_query}".encode()).hexdigest()
@@ -223,72 +368,46 @@ class PowerBIClient:
                 }
             }
             
-            logger.info(f"Executing DAX query on dataset {dataset_id[:8]}...")
+            logger.info("Executing DAX query on dataset %.8s...", dataset_id)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/datasets/{dataset_id}/executeQueries",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
+            session = await self._get_session()
+            async with self._request_with_retry(
+                session,
+                "POST",
+                f"{self.base_url}/datasets/{dataset_id}/executeQueries",
+                headers=headers,
+                data=orjson.dumps(payload),
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                
+                execution_time = (time.monotonic_ns() - start_ns) // 1_000_000
+                
+                if response.status == 200:
+                    results = await self._read_query_results(response)
                     
-                    execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
+                    return self._build_query_result(
+                        results[0] if results else None,
+                        dataset_id,
+                        query_hash,
+                        execution_time,
+                        context
+                    )
+                
+                else:
+                    error_text = await self._read_error_text(response)
+                    logger.error("DAX query failed: %s - %s", response.status, error_text)
+                    error_message = self._extract_error_message(error_text)
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if "results" in data and len(data["results"]) > 0:
-                            result = data["results"][0]
-                            
-                            if "tables" in result and len(result["tables"]) > 0:
-                                table = result["tables"][0]
-                                rows = table.get("rows", [])
-                                
-                                logger.info(f"DAX query successful: {len(rows)} rows in {execution_time}ms")
-                                
-                                return QueryResult(
-                                    success=True,
-                                    data=rows,
-                                    row_count=len(rows),
-                                    execution_time_ms=execution_time,
-                                    dataset_id=dataset_id,
-                                    dataset_name=context.dataset_name if context else None,
-                                    workspace_id=context.workspace_id if context else None,
-                                    workspace_name=context.workspace_name if context else None,
-                                    query_hash=query_hash
-                                )
-                            else:
-                                return QueryResult(
-                                    success=True,
-                                    data=[],
-                                    row_count=0,
-                                    execution_time_ms=execution_time,
-                                    dataset_id=dataset_id,
-                                    query_hash=query_hash
-                                )
-                        else:
-                            return QueryResult(
-                                success=False,
-                                error="No results returned from query",
-                                execution_time_ms=execution_time,
-                                query_hash=query_hash
-                            )
+                    return QueryResult(
+                        success=False,
+                        error=f"Query failed with status {response.status}: {error_message[:200]}",
+                        execution_time_ms=execution_time,
+                        query_hash=query_hash
+                    )
                     
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"DAX query failed: {response.status} - {error_text}")
-                        
-                        return QueryResult(
-                            success=False,
-                            error=f"Query failed with status {response.status}: {error_text[:200]}",
-                            execution_time_ms=execution_time,
-                            query_hash=query_hash
-                        )
-                        
         except Exception as e:
-            execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
-            logger.error(f"Error executing DAX query: {e}", exc_info=True)
+            execution_time = (time.monotonic_ns() - start_ns) // 1_000_000
+            logger.error("Error executing DAX query: %s", e, exc_info=True)
             
             return QueryResult(
                 success=False,
@@ -297,10 +416,116 @@ class PowerBIClient:
                 query_hash=query_hash
             )
     
+    @staticmethod
+    async def _read_query_results(response: aiohttp.ClientResponse) -> List[Dict[str, Any]]:
+        """Read the results array of an executeQueries response"""
+        if not IJSON_AVAILABLE:
+            data = orjson.loads(await response.read())
+            return data.get("results", [])
+        
+        # Parse results as the body arrives instead of buffering the whole payload first
+        results = ijson.sendable_list()
+        parser = ijson.items_coro(results, "results.item", use_float=True)
+        
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            parser.send(chunk)
+        parser.close()
+        
+        return results
+    
+    @staticmethod
+    def _extract_error_message(error_text: str) -> str:
+        """Extract the most specific message from a Power BI error body"""
+        try:
+            error_data = orjson.loads(error_text)
+        except ValueError:
+            return error_text
+        
+        err = error_data.get("error") if isinstance(error_data, dict) else None
+        return PowerBIClient._describe_error(err) if err else error_text
+    
+    @staticmethod
+    def _describe_error(err: Any) -> str:
+        """Most specific message from a Power BI "error" member (whole response or one query result)"""
+        if not isinstance(err, dict):
+            return str(err)
+        
+        details = err.get("pbi.error", {}).get("details") or ()
+        if details:
+            return details[0].get("detail", {}).get("value") or err.get("message", "Unknown error")
+        return err.get("message", "Unknown error")
+    
+    def _build_query_result(self,
+                            result: Optional[Dict[str, Any]],
+                            dataset_id: str,
+                            query_hash: str,
+                            execution_time: int,
+                            context: Optional[PowerBIContext] = None) -> QueryResult:
+        """Build a QueryResult from one entry of an executeQueries response"""
+        if not result:
+            return QueryResult(
+                success=False,
+                error="No results returned from query",
+                execution_time_ms=execution_time,
+                query_hash=query_hash
+            )
+        
+        # A query that fails during evaluation can report its error in its result entry
+        if result.get("error"):
+            error_message = self._describe_error(result["error"])
+            logger.error("DAX query failed: %s", error_message)
+            
+            return QueryResult(
+                success=False,
+                error=f"Query failed: {error_message[:200]}",
+                execution_time_ms=execution_time,
+                dataset_id=dataset_id,
+                query_hash=query_hash
+            )
+        
+        if "tables" in result and len(result["tables"]) > 0:
+            table = result["tables"][0]
+            rows = table.get("rows", [])
+            
+            logger.info("DAX query successful: %d rows in %dms", len(rows), execution_time)
+            
+            return QueryResult(
+                success=True,
+                data=rows,
+                row_count=len(rows),
+                execution_time_ms=execution_time,
+                dataset_id=dataset_id,
+                dataset_name=context.dataset_name if context else None,
+                workspace_id=context.workspace_id if context else None,
+                workspace_name=context.workspace_name if context else None,
+                query_hash=query_hash
+            )
+        
+        return QueryResult(
+            success=True,
+            data=[],
+            row_count=0,
+            execution_time_ms=execution_time,
+            dataset_id=dataset_id,
+            query_hash=query_hash
+        )
+    
     async def validate_connection(self) -> Dict[str, Any]:
         """Validate Power BI connection and permissions"""
+        # Cheap guard first - nothing else to check without authentication
+        if not self.auth_manager.is_configured():
+            return {
+                "auth_configured": False,
+                "token_acquired": False,
+                "api_accessible": False,
+                "workspaces_accessible": False,
+                "workspace_count": 0,
+                "errors": ["Authentication not configured"],
+                "warnings": []
+            }
+        
         validation_result = {
-            "auth_configured": self.auth_manager.is_configured(),
+            "auth_configured": True,
             "token_acquired": False,
             "api_accessible": False,
             "workspaces_accessible": False,
@@ -309,10 +534,6 @@ class PowerBIClient:
             "warnings": []
         }
         
-        if not validation_result["auth_configured"]:
-            validation_result["errors"].append("Authentication not configured")
-            return validation_result
-        
         # Test token acquisition
         token = await self.auth_manager.get_access_token()
         if token:
@@ -320,7 +541,7 @@ class PowerBIClient:
             
             # Test API access
             try:
-                workspaces = await self.get_workspaces(force_refresh=True)
+                workspaces = await self.get_workspaces(max_age=VALIDATION_CACHE_SECONDS)
                 validation_result["api_accessible"] = True
                 validation_result["workspace_count"] = len(workspaces)
                 
@@ -340,4 +561,12 @@ class PowerBIClient:
         """Clear all cached data"""
         self._workspace_cache.clear()
         self._dataset_cache.clear()
-        logger.info("Power BI client cache cleared")
\ No newline at end of file
+        logger.info("Power BI client cache cleared")
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session:
+            await self._session.close()
+            self._session = None
+        
+        logger.info("Power BI client closed")
\ No newline at end of file
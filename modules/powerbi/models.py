@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceInfo:
     """Power BI workspace information"""
     id: str
@@ -33,7 +33,7 @@ class WorkspaceInfo:
             "is_on_dedicated_capacity": self.is_on_dedicated_capacity
         }
 
-@dataclass
+@dataclass(slots=True)
 class DatasetInfo:
     """Power BI dataset information"""
     id: str
@@ -49,6 +49,7 @@ class DatasetInfo:
     tables: List[Dict[str, Any]] = field(default_factory=list)
     measures: List[Dict[str, Any]] = field(default_factory=list)
     last_refresh: Optional[str] = None
+    relevance_score: float = 0.0  # Set by the AI context builder when ranking datasets
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -68,7 +69,7 @@ class DatasetInfo:
             "last_refresh": self.last_refresh
         }
 
-@dataclass
+@dataclass(slots=True)
 class TableInfo:
     """Power BI table information"""
     name: str
@@ -87,7 +88,7 @@ class TableInfo:
             "measures": self.measures
         }
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Result from a DAX query execution"""
     success: bool
@@ -122,7 +123,7 @@ class QueryResult:
             "timestamp": self.timestamp.isoformat() if self.timestamp else None
         }
 
-@dataclass
+@dataclass(slots=True)
 class PowerBIContext:
     """Context for Power BI operations"""
     workspace_id: Optional[str] = None
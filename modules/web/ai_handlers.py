@@ -14,6 +14,7 @@ from aiohttp.web_response import Response
 
 from ..config import ConfigManager
 from ..mcp import IntelligentPowerBIAnalyzer
+from .responses import json_response, read_json, check_json_request
 
 logger = logging.getLogger(__name__)
 
@@ -25,25 +26,32 @@ class AIWebHandlers:
     def __init__(self, config_manager: ConfigManager):
         self.config = config_manager
         self.analyzer = IntelligentPowerBIAnalyzer(config_manager)
+        
+        # Configuration can't change while the process runs, so the health body is built once
+        self._health_base = self._build_health_base()
     
     async def intelligent_analysis_handler(self, request: Request) -> Response:
         """
         Handle intelligent Power BI analysis requests
         """
+        rejection = check_json_request(request)
+        if rejection is not None:
+            return rejection
+        
         try:
             # Parse request data
-            data = await request.json()
+            data = await read_json(request)
             
             user_question = data.get("question", "")
             analysis_depth = data.get("depth", "standard")
             
             if not user_question:
-                return web.json_response({
+                return json_response({
                     "success": False,
                     "error": "Question parameter is required"
                 }, status=400)
             
-            logger.info(f"AI analysis request: {user_question[:50]}...")
+            logger.info("AI analysis request: %.50s...", user_question)
             
             # Perform intelligent analysis
             result = await self.analyzer.intelligent_analysis(
@@ -61,16 +69,18 @@ class AIWebHandlers:
             }
             
             status_code = 200 if result.get("success") else 500
-            return web.json_response(result, status=status_code)
+            return json_response(result, status=status_code)
             
         except json.JSONDecodeError:
-            return web.json_response({
+            return json_response({
                 "success": False,
                 "error": "Invalid JSON in request body"
             }, status=400)
+        except web.HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"AI analysis handler error: {e}", exc_info=True)
-            return web.json_response({
+            logger.error("AI analysis handler error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return json_response({
                 "success": False,
                 "error": f"Internal server error: {str(e)}"
             }, status=500)
@@ -79,19 +89,23 @@ class AIWebHandlers:
         """
         Handle smart DAX query generation requests
         """
+        rejection = check_json_request(request)
+        if rejection is not None:
+            return rejection
+        
         try:
-            data = await request.json()
+            data = await read_json(request)
             
             natural_request = data.get("request", "")
             dataset_context = data.get("dataset_context", "auto")
             
             if not natural_request:
-                return web.json_response({
+                return json_response({
                     "success": False,
                     "error": "Request parameter is required"
                 }, status=400)
             
-            logger.info(f"Smart DAX request: {natural_request[:50]}...")
+            logger.info("Smart DAX request: %.50s...", natural_request)
             
             # Generate smart DAX
             result = await self.analyzer.smart_dax_generation(
@@ -107,11 +121,13 @@ class AIWebHandlers:
             }
             
             status_code = 200 if result.get("success") else 500
-            return web.json_response(result, status=status_code)
+            return json_response(result, status=status_code)
             
+        except web.HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Smart DAX handler error: {e}", exc_info=True)
-            return web.json_response({
+            logger.error("Smart DAX handler error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return json_response({
                 "success": False,
                 "error": f"DAX generation error: {str(e)}"
             }, status=500)
@@ -120,19 +136,23 @@ class AIWebHandlers:
         """
         Handle business insights analysis requests
         """
+        rejection = check_json_request(request)
+        if rejection is not None:
+            return rejection
+        
         try:
-            data = await request.json()
+            data = await read_json(request)
             
             question = data.get("question", "")
             depth = data.get("depth", "standard")
             
             if not question:
-                return web.json_response({
+                return json_response({
                     "success": False,
                     "error": "Question parameter is required"
                 }, status=400)
             
-            logger.info(f"Business insights request: {question[:50]}...")
+            logger.info("Business insights request: %.50s...", question)
             
             # Perform business analysis
             result = await self.analyzer.business_insights_analysis(
@@ -149,11 +169,13 @@ class AIWebHandlers:
             }
             
             status_code = 200 if result.get("success") else 500
-            return web.json_response(result, status=status_code)
+            return json_response(result, status=status_code)
             
+        except web.HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Business insights handler error: {e}", exc_info=True)
-            return web.json_response({
+            logger.error("Business insights handler error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return json_response({
                 "success": False,
                 "error": f"Business analysis error: {str(e)}"
             }, status=500)
@@ -172,11 +194,11 @@ class AIWebHandlers:
                 "web_server_active": True
             }
             
-            return web.json_response(status)
+            return json_response(status)
             
         except Exception as e:
-            logger.error(f"AI status handler error: {e}", exc_info=True)
-            return web.json_response({
+            logger.error("AI status handler error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return json_response({
                 "success": False,
                 "error": f"Status check error: {str(e)}"
             }, status=500)
@@ -186,41 +208,50 @@ class AIWebHandlers:
         Health check endpoint for AI services
         """
         try:
-            health_status = {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "components": {
-                    "ai_analyzer": "healthy" if self.analyzer else "unavailable",
-                    "azure_openai": "configured" if self.config.azure_openai else "not_configured",
-                    "powerbi": "configured" if self.config.powerbi else "not_configured"
-                },
-                "version": "1.0.0"
-            }
-            
-            # Check component health
-            if not self.analyzer.reasoning_engine:
-                health_status["status"] = "degraded"
-                health_status["warnings"] = ["AI reasoning engine not available"]
-            
-            if not self.config.azure_openai:
-                health_status["status"] = "limited"
-                health_status["limitations"] = ["Azure OpenAI not configured - using fallback mode"]
-            
-            return web.json_response(health_status)
+            health_status = dict(self._health_base, timestamp=datetime.now().isoformat())
+            return json_response(health_status)
             
         except Exception as e:
-            logger.error(f"Health check error: {e}", exc_info=True)
-            return web.json_response({
+            logger.error("Health check error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return json_response({
                 "status": "unhealthy",
                 "error": str(e),
                 "timestamp": datetime.now().isoformat()
             }, status=500)
+    
+    def _build_health_base(self) -> Dict[str, Any]:
+        """Build the configuration-derived part of the AI health payload"""
+        health_status = {
+            "status": "healthy",
+            "components": {
+                "ai_analyzer": "healthy" if self.analyzer else "unavailable",
+                "azure_openai": "configured" if self.config.azure_openai else "not_configured",
+                "powerbi": "configured" if self.config.powerbi else "not_configured"
+            },
+            "version": "1.0.0"
+        }
+        
+        # Check component health
+        if not self.analyzer.reasoning_engine:
+            health_status["status"] = "degraded"
+            health_status["warnings"] = ["AI reasoning engine not available"]
+        
+        if not self.config.azure_openai:
+            health_status["status"] = "limited"
+            health_status["limitations"] = ["Azure OpenAI not configured - using fallback mode"]
+        
+        return health_status
+    
+    async def close(self):
+        """Release analyzer resources"""
+        await self.analyzer.close()
 
-def create_ai_routes(config_manager: ConfigManager) -> list:
+def create_ai_routes(config_manager: ConfigManager,
+                     handlers: Optional[AIWebHandlers] = None) -> list:
     """
     Create AI-enhanced web routes
     """
-    handlers = AIWebHandlers(config_manager)
+    handlers = handlers or AIWebHandlers(config_manager)
     
     routes = [
         # AI Analysis Routes
@@ -4,18 +4,43 @@ API Handlers for Power BI MCP Web Application
 
 import json
 import logging
-from typing import Dict, Any
-from aiohttp.web import Request, Response, json_response
+from typing import Dict, Any, Optional
+from datetime import datetime
+from aiohttp import web
+from aiohttp.web import Request, Response
 
 from .mcp_connector import MCPConnector
+from .responses import json_response, read_json, check_json_request
 
 logger = logging.getLogger(__name__)
 
+# Successful workspace/dataset listings are reused for this long
+LISTING_CACHE_TTL_SECONDS = 300
+LISTING_CACHE_MAX_SIZE = 512
+
 class APIHandlers:
     """HTTP API handlers for Power BI MCP operations"""
     
     def __init__(self, mcp_connector: MCPConnector):
         self.mcp_connector = mcp_connector
+        self._listing_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def _get_cached_listing(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached listing payload if it is still fresh"""
+        cached_data = self._listing_cache.get(cache_key)
+        if cached_data and (datetime.now() - cached_data["timestamp"]).total_seconds() < LISTING_CACHE_TTL_SECONDS:
+            return cached_data["data"]
+        return None
+    
+    def _cache_listing(self, cache_key: str, payload: Dict[str, Any]):
+        """Cache a listing payload, dropping the oldest entry when full"""
+        self._listing_cache.pop(cache_key, None)
+        self._listing_cache[cache_key] = {
+            "data": payload,
+            "timestamp": datetime.now()
+        }
+        if len(self._listing_cache) > LISTING_CACHE_MAX_SIZE:
+            self._listing_cache.pop(next(iter(self._listing_cache)))
     
     async def mcp_status(self, request: Request) -> Response:
         """Get MCP server connection status"""
@@ -24,7 +49,7 @@ class APIHandlers:
                 status = await self.mcp_connector.validate_connection()
                 return json_response(status)
         except Exception as e:
-            logger.error(f"Error checking MCP status: {e}")
+            logger.error("Error checking MCP status: %s", e)
             return json_response({
                 "status": "error",
                 "error": str(e)
@@ -37,7 +62,7 @@ class APIHandlers:
                 tools = await self.mcp_connector.list_available_tools()
                 return json_response(tools)
         except Exception as e:
-            logger.error(f"Error listing MCP tools: {e}")
+            logger.error("Error listing MCP tools: %s", e)
             return json_response({
                 "success": False,
                 "error": str(e)
@@ -50,7 +75,10 @@ class APIHandlers:
         try:
             # Get request body
             if request.content_type == 'application/json':
-                body = await request.json()
+                rejection = check_json_request(request)
+                if rejection is not None:
+                    return rejection
+                body = await read_json(request)
                 arguments = body.get('arguments', {})
             else:
                 arguments = {}
@@ -68,8 +96,10 @@ class APIHandlers:
                 "success": False,
                 "error": f"Invalid JSON in request body: {str(e)}"
             }, status=400)
+        except web.HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Error calling MCP tool {tool_name}: {e}")
+            logger.error("Error calling MCP tool %s: %s", tool_name, e)
             return json_response({
                 "success": False,
                 "error": str(e),
@@ -78,6 +108,10 @@ class APIHandlers:
     
     async def list_workspaces(self, request: Request) -> Response:
         """List Power BI workspaces via MCP"""
+        cached = self._get_cached_listing("workspaces")
+        if cached is not None:
+            return json_response(cached)
+        
         try:
             async with self.mcp_connector:
                 result = await self.mcp_connector.list_powerbi_workspaces()
@@ -90,13 +124,15 @@ class APIHandlers:
                     else:
                         workspace_data = mcp_result
                     
-                    return json_response({
+                    payload = {
                         "success": True,
                         "workspaces": workspace_data.get("workspaces", []),
                         "count": len(workspace_data.get("workspaces", [])),
                         "execution_time": result.get("execution_time"),
                         "timestamp": result.get("timestamp")
-                    })
+                    }
+                    self._cache_listing("workspaces", payload)
+                    return json_response(payload)
                 else:
                     return json_response({
                         "success": False,
@@ -105,7 +141,7 @@ class APIHandlers:
                     }, status=400)
                     
         except Exception as e:
-            logger.error(f"Error listing workspaces: {e}")
+            logger.error("Error listing workspaces: %s", e)
             return json_response({
                 "success": False,
                 "error": str(e),
@@ -115,6 +151,11 @@ class APIHandlers:
     async def list_datasets(self, request: Request) -> Response:
         """List datasets in a Power BI workspace via MCP"""
         workspace_name = request.match_info['workspace_name']
+        cache_key = f"datasets:{workspace_name.lower()}"
+        
+        cached = self._get_cached_listing(cache_key)
+        if cached is not None:
+            return json_response(cached)
         
         try:
             async with self.mcp_connector:
@@ -128,14 +169,16 @@ class APIHandlers:
                     else:
                         dataset_data = mcp_result
                     
-                    return json_response({
+                    payload = {
                         "success": True,
                         "workspace": workspace_name,
                         "datasets": dataset_data.get("datasets", []),
                         "count": len(dataset_data.get("datasets", [])),
                         "execution_time": result.get("execution_time"),
                         "timestamp": result.get("timestamp")
-                    })
+                    }
+                    self._cache_listing(cache_key, payload)
+                    return json_response(payload)
                 else:
                     return json_response({
                         "success": False,
@@ -145,7 +188,7 @@ class APIHandlers:
                     }, status=400)
                     
         except Exception as e:
-            logger.error(f"Error listing datasets for workspace {workspace_name}: {e}")
+            logger.error("Error listing datasets for workspace %s: %s", workspace_name, e)
             return json_response({
                 "success": False,
                 "workspace": workspace_name,
@@ -157,13 +200,11 @@ class APIHandlers:
         """Execute DAX query via MCP"""
         try:
             # Get request body
-            if request.content_type != 'application/json':
-                return json_response({
-                    "success": False,
-                    "error": "Content-Type must be application/json"
-                }, status=400)
+            rejection = check_json_request(request)
+            if rejection is not None:
+                return rejection
             
-            body = await request.json()
+            body = await read_json(request)
             
             # Validate required parameters
             required_params = ['workspace_name', 'dataset_name', 'dax_query']
@@ -229,8 +270,10 @@ class APIHandlers:
                 "success": False,
                 "error": f"Invalid JSON in request body: {str(e)}"
             }, status=400)
+        except web.HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Error executing DAX query: {e}")
+            logger.error("Error executing DAX query: %s", e)
             return json_response({
                 "success": False,
                 "error": str(e)
@@ -240,13 +283,11 @@ class APIHandlers:
         """Format content for Teams message display via MCP"""
         try:
             # Get request body
-            if request.content_type != 'application/json':
-                return json_response({
-                    "success": False,
-                    "error": "Content-Type must be application/json"
-                }, status=400)
+            rejection = check_json_request(request)
+            if rejection is not None:
+                return rejection
             
-            body = await request.json()
+            body = await read_json(request)
             
             # Validate required parameters
             if 'content' not in body:
@@ -293,8 +334,10 @@ class APIHandlers:
                 "success": False,
                 "error": f"Invalid JSON in request body: {str(e)}"
             }, status=400)
+        except web.HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Error formatting Teams message: {e}")
+            logger.error("Error formatting Teams message: %s", e)
             return json_response({
                 "success": False,
                 "error": str(e)
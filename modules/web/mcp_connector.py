@@ -5,6 +5,7 @@ MCP Connector for communicating with deployed MCP server
 import json
 import logging
 import aiohttp
+import orjson
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
@@ -21,13 +22,23 @@ class MCPConnector:
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        await self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit - the shared session stays open until close()"""
+        pass
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=200,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
     
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with optional API key"""
@@ -44,17 +55,16 @@ class MCPConnector:
     async def validate_connection(self) -> Dict[str, Any]:
         """Validate connection to MCP server"""
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            session = await self._get_session()
             
-            async with self.session.get(
+            async with session.get(
                 f"{self.mcp_base_url}/health",
                 headers=self._get_headers(),
                 timeout=aiohttp.ClientTimeout(total=10)
             ) as response:
                 
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     self._connection_validated = True
                     
                     return {
@@ -71,14 +81,14 @@ class MCPConnector:
                     }
                     
         except aiohttp.ClientError as e:
-            logger.error(f"Network error connecting to MCP server: {e}")
+            logger.error("Network error connecting to MCP server: %s", e)
             return {
                 "status": "network_error",
                 "error": str(e),
                 "timestamp": datetime.now().isoformat()
             }
         except Exception as e:
-            logger.error(f"Unexpected error validating MCP connection: {e}")
+            logger.error("Unexpected error validating MCP connection: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -88,17 +98,16 @@ class MCPConnector:
     async def list_available_tools(self) -> Dict[str, Any]:
         """Get list of available MCP tools"""
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            session = await self._get_session()
             
-            async with self.session.get(
+            async with session.get(
                 f"{self.mcp_base_url}/tools",
                 headers=self._get_headers(),
                 timeout=aiohttp.ClientTimeout(total=10)
             ) as response:
                 
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     return {
                         "success": True,
                         "tools": data.get("tools", []),
@@ -112,7 +121,7 @@ class MCPConnector:
                     }
                     
         except Exception as e:
-            logger.error(f"Error listing MCP tools: {e}")
+            logger.error("Error listing MCP tools: %s", e)
             return {
                 "success": False,
                 "error": str(e)
@@ -123,8 +132,7 @@ class MCPConnector:
                            arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call an MCP tool on the deployed server"""
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            session = await self._get_session()
             
             payload = {
                 "tool": tool_name,
@@ -134,7 +142,7 @@ class MCPConnector:
             
             logger.info(f"Calling MCP tool: {tool_name}")
             
-            async with self.session.post(
+            async with session.post(
                 f"{self.mcp_base_url}/tools/{tool_name}",
                 headers=self._get_headers(),
                 json=payload,
@@ -142,7 +150,7 @@ class MCPConnector:
             ) as response:
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     logger.info(f"MCP tool {tool_name} executed successfully")
                     
                     return {
@@ -154,7 +162,7 @@ class MCPConnector:
                     }
                 else:
                     error_text = await response.text()
-                    logger.error(f"MCP tool {tool_name} failed: {response.status}")
+                    logger.error("MCP tool %s failed: %s", tool_name, response.status)
                     
                     return {
                         "success": False,
@@ -164,7 +172,7 @@ class MCPConnector:
                     }
                     
         except aiohttp.ClientError as e:
-            logger.error(f"Network error calling MCP tool {tool_name}: {e}")
+            logger.error("Network error calling MCP tool %s: %s", tool_name, e)
             return {
                 "success": False,
                 "error": f"Network error: {str(e)}",
@@ -172,7 +180,7 @@ class MCPConnector:
                 "timestamp": datetime.now().isoformat()
             }
         except Exception as e:
-            logger.error(f"Error calling MCP tool {tool_name}: {e}", exc_info=True)
+            logger.error("Error calling MCP tool %s: %s", tool_name, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return {
                 "success": False,
                 "error": str(e),
@@ -0,0 +1,55 @@
+"""
+JSON request/response helpers backed by orjson
+"""
+
+from typing import Any, Optional
+
+import orjson
+from aiohttp import web
+from aiohttp.web import Request, Response
+
+# Largest JSON request body accepted (matches aiohttp's default client_max_size)
+MAX_JSON_BODY_BYTES = 1024 ** 2
+
+def json_response(data: Any, status: int = 200) -> Response:
+    """Serialize data with orjson into an application/json response"""
+    return web.Response(
+        body=orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        content_type="application/json"
+    )
+
+def _too_large_payload() -> dict:
+    """Body of the 413 response for oversized JSON requests"""
+    return {
+        "success": False,
+        "error": f"Request body exceeds {MAX_JSON_BODY_BYTES} bytes"
+    }
+
+async def read_json(request: Request) -> Any:
+    """Parse the request body with orjson (raises orjson.JSONDecodeError, a json.JSONDecodeError, or a JSON 413)"""
+    try:
+        body = await request.read()
+    except web.HTTPRequestEntityTooLarge as e:
+        # Chunked bodies carry no Content-Length, so the limit is only hit while reading
+        # (reading stops one chunk past it, so the actual size is unknown)
+        raise web.HTTPRequestEntityTooLarge(
+            max_size=MAX_JSON_BODY_BYTES,
+            actual_size=MAX_JSON_BODY_BYTES + 1,
+            text=orjson.dumps(_too_large_payload()).decode(),
+            content_type="application/json"
+        ) from e
+    return orjson.loads(body)
+
+def check_json_request(request: Request) -> Optional[Response]:
+    """Reject non-JSON or oversized bodies from the headers alone, before reading them"""
+    if request.content_type != "application/json":
+        return json_response({
+            "success": False,
+            "error": "Content-Type must be application/json"
+        }, status=415)
+    
+    if request.content_length is not None and request.content_length > MAX_JSON_BODY_BYTES:
+        return json_response(_too_large_payload(), status=413)
+    
+    return None
@@ -3,21 +3,175 @@ Web Server for Power BI MCP Web Application
 Provides HTTP API and web interface
 """
 
+import os
 import json
 import logging
 import asyncio
+import orjson
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from aiohttp import web, ClientError
-from aiohttp.web import Request, Response, RouteTableDef
-import aiohttp_cors
+from aiohttp.web import Request, Response
 
 from .mcp_connector import MCPConnector
 from .api_handlers import APIHandlers
-from .ai_handlers import create_ai_routes, create_ai_documentation
+from .ai_handlers import AIWebHandlers, create_ai_routes, create_ai_documentation
+from .responses import json_response
 from ..config import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Server tuning: keep-alive window, accept backlog and in-flight limit for upstream-bound routes
+KEEPALIVE_TIMEOUT_SECONDS = 75
+LISTEN_BACKLOG = 2048
+MAX_CONCURRENT_API_REQUESTS = 4 * (os.cpu_count() or 1)
+BOUNDED_PATH_PREFIXES = ("/api/", "/ai/", "/mcp/")
+
+# Response headers browsers expose without Access-Control-Expose-Headers (lowercase)
+CORS_SAFELISTED_RESPONSE_HEADERS = frozenset({
+    "cache-control", "content-language", "content-type", "expires", "last-modified", "pragma"
+})
+
+# Static web interface, encoded once at import time
+WEB_INTERFACE_HTML = """
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>Power BI MCP Web Application</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }
+                .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+                h1 { color: #333; border-bottom: 3px solid #0078d4; padding-bottom: 10px; }
+                .status-card { background: #f8f9fa; padding: 20px; margin: 20px 0; border-radius: 6px; border-left: 4px solid #0078d4; }
+                .endpoints { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 20px 0; }
+                .endpoint-card { background: #fff; border: 1px solid #ddd; padding: 15px; border-radius: 6px; }
+                .endpoint-card h3 { margin-top: 0; color: #0078d4; }
+                button { background: #0078d4; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; }
+                button:hover { background: #106ebe; }
+                .json-result { background: #f8f9fa; padding: 15px; border-radius: 4px; font-family: monospace; white-space: pre-wrap; margin-top: 10px; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>🔧 Power BI MCP Web Application</h1>
+                
+                <div class="status-card">
+                    <h2>📊 Service Status</h2>
+                    <p>This web application provides a modular interface to your deployed Power BI MCP server.</p>
+                    <button onclick="checkStatus()">Check Status</button>
+                    <div id="status-result" class="json-result" style="display:none;"></div>
+                </div>
+                
+                <div class="endpoints">
+                    <div class="endpoint-card">
+                        <h3>🏢 Workspaces</h3>
+                        <p>List all accessible Power BI workspaces</p>
+                        <button onclick="listWorkspaces()">List Workspaces</button>
+                        <div id="workspaces-result" class="json-result" style="display:none;"></div>
+                    </div>
+                    
+                    <div class="endpoint-card">
+                        <h3>🔧 MCP Tools</h3>
+                        <p>View available MCP tools on the server</p>
+                        <button onclick="listTools()">List Tools</button>
+                        <div id="tools-result" class="json-result" style="display:none;"></div>
+                    </div>
+                    
+                    <div class="endpoint-card">
+                        <h3>⚡ DAX Query</h3>
+                        <p>Execute DAX queries against datasets</p>
+                        <input type="text" id="workspace-input" placeholder="Workspace name" style="width:100%; margin:5px 0; padding:8px;">
+                        <input type="text" id="dataset-input" placeholder="Dataset name" style="width:100%; margin:5px 0; padding:8px;">
+                        <textarea id="dax-input" placeholder="DAX Query" style="width:100%; height:60px; margin:5px 0; padding:8px;"></textarea>
+                        <button onclick="executeDax()">Execute Query</button>
+                        <div id="dax-result" class="json-result" style="display:none;"></div>
+                    </div>
+                </div>
+                
+                <div class="status-card">
+                    <h2>🔗 API Endpoints</h2>
+                    <ul>
+                        <li><strong>GET /health</strong> - Health check</li>
+                        <li><strong>GET /status</strong> - Detailed status</li>
+                        <li><strong>GET /api/powerbi/workspaces</strong> - List workspaces</li>
+                        <li><strong>POST /api/powerbi/query</strong> - Execute DAX query</li>
+                        <li><strong>GET /mcp/tools</strong> - List MCP tools</li>
+                    </ul>
+                </div>
+            </div>
+            
+            <script>
+                async function checkStatus() {
+                    try {
+                        const response = await fetch('/status');
+                        const data = await response.json();
+                        document.getElementById('status-result').style.display = 'block';
+                        document.getElementById('status-result').textContent = JSON.stringify(data, null, 2);
+                    } catch (error) {
+                        document.getElementById('status-result').style.display = 'block';
+                        document.getElementById('status-result').textContent = 'Error: ' + error.message;
+                    }
+                }
+                
+                async function listWorkspaces() {
+                    try {
+                        const response = await fetch('/api/powerbi/workspaces');
+                        const data = await response.json();
+                        document.getElementById('workspaces-result').style.display = 'block';
+                        document.getElementById('workspaces-result').textContent = JSON.stringify(data, null, 2);
+                    } catch (error) {
+                        document.getElementById('workspaces-result').style.display = 'block';
+                        document.getElementById('workspaces-result').textContent = 'Error: ' + error.message;
+                    }
+                }
+                
+                async function listTools() {
+                    try {
+                        const response = await fetch('/mcp/tools');
+                        const data = await response.json();
+                        document.getElementById('tools-result').style.display = 'block';
+                        document.getElementById('tools-result').textContent = JSON.stringify(data, null, 2);
+                    } catch (error) {
+                        document.getElementById('tools-result').style.display = 'block';
+                        document.getElementById('tools-result').textContent = 'Error: ' + error.message;
+                    }
+                }
+                
+                async function executeDax() {
+                    const workspace = document.getElementById('workspace-input').value;
+                    const dataset = document.getElementById('dataset-input').value; 
+                    const dax = document.getElementById('dax-input').value;
+                    
+                    if (!workspace || !dataset || !dax) {
+                        alert('Please fill in all fields');
+                        return;
+                    }
+                    
+                    try {
+                        const response = await fetch('/api/powerbi/query', {
+                            method: 'POST',
+                            headers: { 'Content-Type': 'application/json' },
+                            body: JSON.stringify({
+                                workspace_name: workspace,
+                                dataset_name: dataset,
+                                dax_query: dax
+                            })
+                        });
+                        const data = await response.json();
+                        document.getElementById('dax-result').style.display = 'block';
+                        document.getElementById('dax-result').textContent = JSON.stringify(data, null, 2);
+                    } catch (error) {
+                        document.getElementById('dax-result').style.display = 'block';
+                        document.getElementById('dax-result').textContent = 'Error: ' + error.message;
+                    }
+                }
+            </script>
+        </body>
+        </html>
+        """.encode("utf-8")
+
 class WebServer:
     """Web server for Power BI MCP application"""
     
@@ -26,22 +180,35 @@ class WebServer:
                  mcp_api_key: Optional[str] = None,
                  host: str = "0.0.0.0",
                  port: int = 8080,
-                 config_manager: Optional[ConfigManager] = None):
+                 config_manager: Optional[ConfigManager] = None,
+                 reuse_port: bool = False):
         
         self.mcp_url = mcp_url
         self.mcp_api_key = mcp_api_key
         self.host = host
         self.port = port
         self.config_manager = config_manager
+        self.reuse_port = reuse_port
+        
+        # Bounds concurrent requests that wait on MCP / Power BI / OpenAI
+        self._api_semaphore = asyncio.Semaphore(MAX_CONCURRENT_API_REQUESTS)
         
         # Initialize MCP connector
         self.mcp_connector = MCPConnector(mcp_url, mcp_api_key)
         
         # Initialize API handlers
         self.api_handlers = APIHandlers(self.mcp_connector)
+        self.ai_handlers: Optional[AIWebHandlers] = None
         
         # Create web application
         self.app = self._create_app()
+        
+        # The /info payload only depends on configuration, so serialize it once
+        self._info_body = orjson.dumps(self._build_info_data())
+        
+        # Health timestamp refreshed once a second by a background task
+        self._timestamp = self._format_timestamp()
+        self._timestamp_task: Optional[asyncio.Task] = None
     
     def _create_app(self) -> web.Application:
         """Create and configure the web application"""
@@ -51,7 +218,8 @@ class WebServer:
         self._add_routes(app)
         
         # Add CORS support
-        self._add_cors(app)
+        if not self.config_manager or self.config_manager.web.enable_cors:
+            app.middlewares.append(self._cors_middleware)
         
         # Add error handling middleware
         app.middlewares.append(self._error_middleware)
@@ -59,56 +227,81 @@ class WebServer:
         # Add request logging middleware
         app.middlewares.append(self._logging_middleware)
         
+        # Limit in-flight upstream-bound requests
+        app.middlewares.append(self._concurrency_middleware)
+        
         return app
     
     def _add_routes(self, app: web.Application):
         """Add all routes to the application"""
-        routes = web.RouteTableDef()
-        
-        # Health and info endpoints
-        routes.get('/health', self._health_handler)
-        routes.get('/info', self._info_handler)
-        routes.get('/status', self._status_handler)
-        
-        # MCP connection endpoints
-        routes.get('/mcp/status', self.api_handlers.mcp_status)
-        routes.get('/mcp/tools', self.api_handlers.list_mcp_tools)
-        routes.post('/mcp/tools/{tool_name}', self.api_handlers.call_mcp_tool)
-        
-        # Power BI endpoints (proxied through MCP)
-        routes.get('/api/powerbi/workspaces', self.api_handlers.list_workspaces)
-        routes.get('/api/powerbi/workspaces/{workspace_name}/datasets', self.api_handlers.list_datasets)
-        routes.post('/api/powerbi/query', self.api_handlers.execute_dax_query)
-        
-        # Teams integration endpoints
-        routes.post('/api/teams/format', self.api_handlers.format_teams_message)
-        
-        # Static file serving for web interface
-        routes.get('/', self._web_interface_handler)
-        routes.get('/dashboard', self._dashboard_handler)
-        
-        app.add_routes(routes)
+        app.add_routes([
+            # Health and info endpoints
+            web.get('/health', self._health_handler),
+            web.get('/info', self._info_handler),
+            web.get('/status', self._status_handler),
+            
+            # MCP connection endpoints
+            web.get('/mcp/status', self.api_handlers.mcp_status),
+            web.get('/mcp/tools', self.api_handlers.list_mcp_tools),
+            web.post('/mcp/tools/{tool_name}', self.api_handlers.call_mcp_tool),
+            
+            # Power BI endpoints (proxied through MCP)
+            web.get('/api/powerbi/workspaces', self.api_handlers.list_workspaces),
+            web.get('/api/powerbi/workspaces/{workspace_name}/datasets', self.api_handlers.list_datasets),
+            web.post('/api/powerbi/query', self.api_handlers.execute_dax_query),
+            
+            # Teams integration endpoints
+            web.post('/api/teams/format', self.api_handlers.format_teams_message),
+            
+            # Static file serving for web interface
+            web.get('/', self._web_interface_handler),
+            web.get('/dashboard', self._dashboard_handler)
+        ])
         
         # Add AI-enhanced routes if config manager is available
         if self.config_manager:
-            ai_routes = create_ai_routes(self.config_manager)
+            self.ai_handlers = AIWebHandlers(self.config_manager)
+            ai_routes = create_ai_routes(self.config_manager, self.ai_handlers)
             app.add_routes(ai_routes)
             logger.info("AI-enhanced routes added to web server")
     
-    def _add_cors(self, app: web.Application):
-        """Add CORS support"""
-        cors = aiohttp_cors.setup(app, defaults={
-            "*": aiohttp_cors.ResourceOptions(
-                allow_credentials=True,
-                expose_headers="*",
-                allow_headers="*",
-                allow_methods="*"
-            )
-        })
+    @web.middleware
+    async def _cors_middleware(self, request: Request, handler):
+        """Allow cross-origin requests from any origin, answering preflights directly"""
+        origin = request.headers.get("Origin")
+        if not origin:
+            return await handler(request)
+        
+        if request.method == "OPTIONS" and "Access-Control-Request-Method" in request.headers:
+            response = web.Response()
+            response.headers["Access-Control-Allow-Methods"] = request.headers["Access-Control-Request-Method"]
+            requested_headers = request.headers.get("Access-Control-Request-Headers")
+            if requested_headers:
+                response.headers["Access-Control-Allow-Headers"] = requested_headers
+        else:
+            response = await handler(request)
+            
+            # Expose every non-safelisted header ("*" is literal when credentials are allowed)
+            exposed = {
+                name: None for name in response.headers
+                if name.lower() not in CORS_SAFELISTED_RESPONSE_HEADERS
+            }
+            if exposed:
+                response.headers["Access-Control-Expose-Headers"] = ",".join(exposed)
         
-        # Add CORS to all routes
-        for route in list(app.router.routes()):
-            cors.add(route)
+        response.headers["Access-Control-Allow-Origin"] = origin
+        response.headers["Access-Control-Allow-Credentials"] = "true"
+        response.headers["Vary"] = "Origin"
+        return response
+    
+    @web.middleware
+    async def _concurrency_middleware(self, request: Request, handler):
+        """Queue API requests beyond MAX_CONCURRENT_API_REQUESTS instead of starving the loop"""
+        if not request.path.startswith(BOUNDED_PATH_PREFIXES):
+            return await handler(request)
+        
+        async with self._api_semaphore:
+            return await handler(request)
     
     @web.middleware
     async def _error_middleware(self, request: Request, handler):
@@ -118,8 +311,8 @@ class WebServer:
         except web.HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Unhandled error in {request.method} {request.path}: {e}", exc_info=True)
-            return web.json_response({
+            logger.exception("Unhandled error in %s %s: %s", request.method, request.path, e)
+            return json_response({
                 "error": "Internal server error",
                 "message": str(e),
                 "path": request.path,
@@ -136,13 +329,13 @@ class WebServer:
             
             # Log successful requests
             duration = (asyncio.get_event_loop().time() - start_time) * 1000
-            logger.info(f"{request.method} {request.path} - {response.status} - {duration:.2f}ms")
+            logger.info("%s %s - %s - %.2fms", request.method, request.path, response.status, duration)
             
             return response
         except Exception as e:
             # Log errors
             duration = (asyncio.get_event_loop().time() - start_time) * 1000
-            logger.error(f"{request.method} {request.path} - ERROR - {duration:.2f}ms: {e}")
+            logger.error("%s %s - ERROR - %.2fms: %s", request.method, request.path, duration, e)
             raise
     
     async def _health_handler(self, request: Request) -> Response:
@@ -154,7 +347,7 @@ class WebServer:
             "status": "healthy" if mcp_status["status"] == "connected" else "unhealthy",
             "service": "Power BI MCP Web Application",
             "version": "1.0.0",
-            "timestamp": "2025-01-28T00:00:00Z",  # Would use real timestamp
+            "timestamp": self._timestamp,
             "components": {
                 "web_server": "healthy",
                 "mcp_connection": mcp_status["status"]
@@ -163,10 +356,25 @@ class WebServer:
         }
         
         status_code = 200 if health_data["status"] == "healthy" else 503
-        return web.json_response(health_data, status=status_code)
+        return json_response(health_data, status=status_code)
+    
+    @staticmethod
+    def _format_timestamp() -> str:
+        """Current UTC time at one-second resolution"""
+        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    async def _update_timestamp(self):
+        """Keep the cached health timestamp current"""
+        while True:
+            self._timestamp = self._format_timestamp()
+            await asyncio.sleep(1)
     
     async def _info_handler(self, request: Request) -> Response:
         """Service information endpoint"""
+        return web.Response(body=self._info_body, content_type="application/json")
+    
+    def _build_info_data(self) -> Dict[str, Any]:
+        """Build the service information payload"""
         info_data = {
             "name": "Power BI MCP Web Application",
             "version": "1.0.0",
@@ -203,10 +411,10 @@ class WebServer:
             info_data["endpoints"].update(ai_endpoints)
             info_data["ai_documentation"] = create_ai_documentation()
         
-        return web.json_response(info_data)
+        return info_data
     
     async def _status_handler(self, request: Request) -> Response:
-        \"\"\"Detailed status endpoint\"\"\"
+        """Detailed status endpoint"""
         # Validate MCP connection
         mcp_status = await self.mcp_connector.validate_connection()
         
@@ -221,7 +429,7 @@ class WebServer:
                     "tools": [tool["name"] for tool in tools_result["tools"]]
                 }
         
-        return web.json_response({
+        return json_response({
             "service": {
                 "name": "Power BI MCP Web Application",
                 "version": "1.0.0",
@@ -239,154 +447,15 @@ class WebServer:
         })
     
     async def _web_interface_handler(self, request: Request) -> Response:
-        \"\"\"Serve the main web interface\"\"\"
-        html_content = \"\"\"
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Power BI MCP Web Application</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 40px; background: #f5f5f5; }
-                .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-                h1 { color: #333; border-bottom: 3px solid #0078d4; padding-bottom: 10px; }
-                .status-card { background: #f8f9fa; padding: 20px; margin: 20px 0; border-radius: 6px; border-left: 4px solid #0078d4; }
-                .endpoints { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 20px 0; }
-                .endpoint-card { background: #fff; border: 1px solid #ddd; padding: 15px; border-radius: 6px; }
-                .endpoint-card h3 { margin-top: 0; color: #0078d4; }
-                button { background: #0078d4; color: white; border: none; padding: 10px 20px; border-radius: 4px; cursor: pointer; }
-                button:hover { background: #106ebe; }
-                .json-result { background: #f8f9fa; padding: 15px; border-radius: 4px; font-family: monospace; white-space: pre-wrap; margin-top: 10px; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>🔧 Power BI MCP Web Application</h1>
-                
-                <div class="status-card">
-                    <h2>📊 Service Status</h2>
-                    <p>This web application provides a modular interface to your deployed Power BI MCP server.</p>
-                    <button onclick="checkStatus()">Check Status</button>
-                    <div id="status-result" class="json-result" style="display:none;"></div>
-                </div>
-                
-                <div class="endpoints">
-                    <div class="endpoint-card">
-                        <h3>🏢 Workspaces</h3>
-                        <p>List all accessible Power BI workspaces</p>
-                        <button onclick="listWorkspaces()">List Workspaces</button>
-                        <div id="workspaces-result" class="json-result" style="display:none;"></div>
-                    </div>
-                    
-                    <div class="endpoint-card">
-                        <h3>🔧 MCP Tools</h3>
-                        <p>View available MCP tools on the server</p>
-                        <button onclick="listTools()">List Tools</button>
-                        <div id="tools-result" class="json-result" style="display:none;"></div>
-                    </div>
-                    
-                    <div class="endpoint-card">
-                        <h3>⚡ DAX Query</h3>
-                        <p>Execute DAX queries against datasets</p>
-                        <input type="text" id="workspace-input" placeholder="Workspace name" style="width:100%; margin:5px 0; padding:8px;">
-                        <input type="text" id="dataset-input" placeholder="Dataset name" style="width:100%; margin:5px 0; padding:8px;">
-                        <textarea id="dax-input" placeholder="DAX Query" style="width:100%; height:60px; margin:5px 0; padding:8px;"></textarea>
-                        <button onclick="executeDax()">Execute Query</button>
-                        <div id="dax-result" class="json-result" style="display:none;"></div>
-                    </div>
-                </div>
-                
-                <div class="status-card">
-                    <h2>🔗 API Endpoints</h2>
-                    <ul>
-                        <li><strong>GET /health</strong> - Health check</li>
-                        <li><strong>GET /status</strong> - Detailed status</li>
-                        <li><strong>GET /api/powerbi/workspaces</strong> - List workspaces</li>
-                        <li><strong>POST /api/powerbi/query</strong> - Execute DAX query</li>
-                        <li><strong>GET /mcp/tools</strong> - List MCP tools</li>
-                    </ul>
-                </div>
-            </div>
-            
-            <script>
-                async function checkStatus() {
-                    try {
-                        const response = await fetch('/status');
-                        const data = await response.json();
-                        document.getElementById('status-result').style.display = 'block';
-                        document.getElementById('status-result').textContent = JSON.stringify(data, null, 2);
-                    } catch (error) {
-                        document.getElementById('status-result').style.display = 'block';
-                        document.getElementById('status-result').textContent = 'Error: ' + error.message;
-                    }
-                }
-                
-                async function listWorkspaces() {
-                    try {
-                        const response = await fetch('/api/powerbi/workspaces');
-                        const data = await response.json();
-                        document.getElementById('workspaces-result').style.display = 'block';
-                        document.getElementById('workspaces-result').textContent = JSON.stringify(data, null, 2);
-                    } catch (error) {
-                        document.getElementById('workspaces-result').style.display = 'block';
-                        document.getElementById('workspaces-result').textContent = 'Error: ' + error.message;
-                    }
-                }
-                
-                async function listTools() {
-                    try {
-                        const response = await fetch('/mcp/tools');
-                        const data = await response.json();
-                        document.getElementById('tools-result').style.display = 'block';
-                        document.getElementById('tools-result').textContent = JSON.stringify(data, null, 2);
-                    } catch (error) {
-                        document.getElementById('tools-result').style.display = 'block';
-                        document.getElementById('tools-result').textContent = 'Error: ' + error.message;
-                    }
-                }
-                
-                async function executeDax() {
-                    const workspace = document.getElementById('workspace-input').value;
-                    const dataset = document.getElementById('dataset-input').value; 
-                    const dax = document.getElementById('dax-input').value;
-                    
-                    if (!workspace || !dataset || !dax) {
-                        alert('Please fill in all fields');
-                        return;
-                    }
-                    
-                    try {
-                        const response = await fetch('/api/powerbi/query', {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify({
-                                workspace_name: workspace,
-                                dataset_name: dataset,
-                                dax_query: dax
-                            })
-                        });
-                        const data = await response.json();
-                        document.getElementById('dax-result').style.display = 'block';
-                        document.getElementById('dax-result').textContent = JSON.stringify(data, null, 2);
-                    } catch (error) {
-                        document.getElementById('dax-result').style.display = 'block';
-                        document.getElementById('dax-result').textContent = 'Error: ' + error.message;
-                    }
-                }
-            </script>
-        </body>
-        </html>
-        \"\"\"
-        
-        return web.Response(text=html_content, content_type='text/html')
+        """Serve the main web interface"""
+        return web.Response(body=WEB_INTERFACE_HTML, content_type='text/html', charset='utf-8')
     
     async def _dashboard_handler(self, request: Request) -> Response:
-        \"\"\"Serve the dashboard interface\"\"\"
+        """Serve the dashboard interface"""
         return await self._web_interface_handler(request)
     
     async def start(self):
-        \"\"\"Start the web server\"\"\"
+        """Start the web server"""
         logger.info(f"Starting Power BI MCP Web Server on {self.host}:{self.port}")
         logger.info(f"MCP Server: {self.mcp_url}")
         logger.info(f"Web Interface: http://{self.host}:{self.port}")
@@ -400,11 +469,24 @@ class WebServer:
             else:
                 logger.warning(f"⚠️ MCP server connection issue: {connection_status['error']}")
         
+        self._timestamp_task = asyncio.create_task(self._update_timestamp())
+        
         # Start the web server
-        runner = web.AppRunner(self.app)
+        # Requests are already logged by _logging_middleware, so aiohttp's access log is disabled
+        runner = web.AppRunner(
+            self.app,
+            keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+            access_log=None
+        )
         await runner.setup()
         
-        site = web.TCPSite(runner, self.host, self.port)
+        site = web.TCPSite(
+            runner,
+            self.host,
+            self.port,
+            backlog=LISTEN_BACKLOG,
+            reuse_port=self.reuse_port
+        )
         await site.start()
         
         logger.info("✅ Web server started successfully")
@@ -412,6 +494,14 @@ class WebServer:
         return runner
     
     async def cleanup(self):
-        \"\"\"Cleanup resources\"\"\"
+        """Cleanup resources"""
+        if self._timestamp_task:
+            self._timestamp_task.cancel()
+            self._timestamp_task = None
+        
         await self.mcp_connector.close()
+        
+        if self.ai_handlers:
+            await self.ai_handlers.close()
+        
         logger.info("Web server cleanup complete")
\ No newline at end of file
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI context builder's dataset selection
+Uses a stub Power BI client (run with pytest)
+"""
+
+import sys
+from typing import Dict, List
+
+import pytest
+
+from modules.ai.context_builder import PowerBIContext, PowerBIContextBuilder
+from modules.powerbi.models import DatasetInfo, WorkspaceInfo
+
+class StubPowerBIClient:
+    """Serves fixed datasets per workspace"""
+    
+    def __init__(self, datasets: Dict[str, List[DatasetInfo]]):
+        self._datasets = datasets
+    
+    async def get_datasets(self, workspace_id: str) -> List[DatasetInfo]:
+        return self._datasets.get(workspace_id, [])
+
+def make_dataset(name: str, workspace: WorkspaceInfo) -> DatasetInfo:
+    return DatasetInfo(id=name.lower(), name=name, workspace_id=workspace.id, workspace_name=workspace.name)
+
+async def test_find_relevant_datasets_ranks_by_relevance():
+    workspace = WorkspaceInfo(id="ws1", name="Finance")
+    datasets = [
+        make_dataset("HR Headcount", workspace),
+        make_dataset("Order Book", workspace),
+        make_dataset("Sales Revenue", workspace)
+    ]
+    builder = PowerBIContextBuilder(StubPowerBIClient({"ws1": datasets}))
+    context = PowerBIContext(
+        query="Show sales revenue",
+        intent="sales_analysis",
+        available_workspaces=[workspace]
+    )
+    
+    await builder._find_relevant_datasets(context)
+    
+    assert [ds.name for ds in context.relevant_datasets] == ["Sales Revenue", "Order Book"]
+    assert all(ds.relevance_score > 0.3 for ds in context.relevant_datasets)
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for Power BI client DAX query execution
+Simulates the executeQueries endpoint in-process (run with pytest)
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from typing import List
+
+import orjson
+import pytest
+
+from modules.powerbi.client import ERROR_BODY_LIMIT, PowerBIClient
+
+# A query containing this marker makes the simulated endpoint fail the request
+BAD_QUERY_MARKER = "BAD"
+
+_SYNTAX_ERROR = {
+    "code": "DatasetExecuteQueriesError",
+    "pbi.error": {"details": [{"detail": {"value": "Syntax error in DAX query"}}]}
+}
+_TOO_MANY_QUERIES_ERROR = {
+    "code": "InvalidRequest",
+    "message": "Only one query per request is supported"
+}
+
+class FakeContent:
+    """Response body stream"""
+    
+    def __init__(self, body: bytes):
+        self._body = body
+    
+    async def read(self, n: int = -1) -> bytes:
+        size = len(self._body) if n < 0 else n
+        chunk, self._body = self._body[:size], self._body[size:]
+        return chunk
+    
+    async def iter_chunked(self, n: int):
+        yield self._body
+
+class ChunkedContent(FakeContent):
+    """Response body stream that delivers a few bytes per read, like a chunked body"""
+    
+    def __init__(self, body: bytes, chunk_size: int):
+        super().__init__(body)
+        self._chunk_size = chunk_size
+    
+    async def read(self, n: int = -1) -> bytes:
+        size = self._chunk_size if n < 0 else min(n, self._chunk_size)
+        chunk, self._body = self._body[:size], self._body[size:]
+        return chunk
+
+class FakeResponse:
+    """Minimal aiohttp response"""
+    
+    def __init__(self, status: int, payload: dict):
+        self.status = status
+        self._body = orjson.dumps(payload)
+        self.content = FakeContent(self._body)
+    
+    async def read(self) -> bytes:
+        return self._body
+
+class FakeAuthManager:
+    """Auth manager that always has a token"""
+    
+    def __init__(self):
+        self.token_generation = 0
+    
+    async def get_access_token(self) -> str:
+        return "test-token"
+    
+    def is_configured(self) -> bool:
+        return True
+
+class FakePowerBIClient(PowerBIClient):
+    """PowerBIClient whose executeQueries endpoint is simulated in-process"""
+    
+    def __init__(self):
+        super().__init__(FakeAuthManager())
+        self.requests: List[List[str]] = []
+        self.gate = None  # asyncio.Event holding requests in flight until set
+    
+    async def _get_session(self):
+        return None
+    
+    @asynccontextmanager
+    async def _request_with_retry(self, session, method, url, **kwargs):
+        if method == "GET":
+            self.requests.append([url])
+            yield FakeResponse(200, {"value": [{"id": "ws1", "name": "Sales"}]})
+            return
+        
+        queries = [item["query"] for item in orjson.loads(kwargs["data"])["queries"]]
+        self.requests.append(queries)
+        
+        if self.gate is not None:
+            await self.gate.wait()
+        
+        # Like Power BI, executeQueries takes exactly one query per request
+        if len(queries) != 1:
+            yield FakeResponse(400, {"error": _TOO_MANY_QUERIES_ERROR})
+        elif BAD_QUERY_MARKER in queries[0]:
+            yield FakeResponse(400, {"error": _SYNTAX_ERROR})
+        else:
+            yield FakeResponse(200, {
+                "results": [{"tables": [{"rows": [{"[Query]": query}]}]} for query in queries]
+            })
+
+async def settle():
+    """Let pending tasks (fake requests) run until they block"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+@pytest.fixture
+def client():
+    return FakePowerBIClient()
+
+def test_result_with_error_member_is_a_failure(client):
+    result = client._build_query_result({"error": _SYNTAX_ERROR}, "ds", "hash", 5)
+    
+    assert result.success is False
+    assert result.error == "Query failed: Syntax error in DAX query"
+
+async def test_execute_dax_queries_sends_one_request_per_query(client):
+    results = await client.execute_dax_queries("ds", ["Q1", "Q2", "Q3"])
+    
+    assert sorted(client.requests) == [["Q1"], ["Q2"], ["Q3"]]
+    assert [result.data for result in results] == [[{"[Query]": q}] for q in ("Q1", "Q2", "Q3")]
+
+async def test_execute_dax_queries_fails_only_the_bad_query(client):
+    results = await client.execute_dax_queries("ds", ["Q1", "BAD", "Q2"])
+    
+    assert len(client.requests) == 3
+    assert [result.success for result in results] == [True, False, True]
+    assert results[1].error == "Query failed with status 400: Syntax error in DAX query"
+
+async def test_error_text_is_read_across_chunks():
+    body = orjson.dumps({"error": _SYNTAX_ERROR})
+    response = FakeResponse(400, {})
+    response.content = ChunkedContent(body, chunk_size=7)
+    
+    error_text = await PowerBIClient._read_error_text(response)
+    
+    assert error_text == body.decode()
+    assert PowerBIClient._extract_error_message(error_text) == "Syntax error in DAX query"
+
+async def test_error_text_stops_at_the_limit():
+    response = FakeResponse(400, {})
+    response.content = ChunkedContent(b"x" * (ERROR_BODY_LIMIT * 2), chunk_size=1000)
+    
+    assert len(await PowerBIClient._read_error_text(response)) == ERROR_BODY_LIMIT
+
+async def test_single_query_is_sent_without_waiting(client):
+    client.gate = asyncio.Event()
+    task = asyncio.create_task(client.execute_dax_query("ds", "Q1"))
+    await settle()
+    
+    # Sent straight away, without waiting for other queries to batch with
+    assert client.requests == [["Q1"]]
+    
+    client.gate.set()
+    result = await task
+    assert result.success is True
+    assert result.data == [{"[Query]": "Q1"}]
+
+async def test_workspace_cache_is_dropped_when_the_token_changes(client):
+    await client.get_workspaces()
+    await client.get_workspaces()
+    assert len(client.requests) == 1
+    
+    # A token refresh (or failed refresh) invalidates data listed under the old token
+    client.auth_manager.token_generation += 1
+    workspaces = await client.get_workspaces()
+    
+    assert len(client.requests) == 2
+    assert [ws.name for ws in workspaces] == ["Sales"]
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the web server's request handling
+Drives the aiohttp application in-process (run with pytest)
+"""
+
+import sys
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from modules.web.responses import MAX_JSON_BODY_BYTES
+from modules.web.web_server import WebServer
+
+ORIGIN = "https://app.example.com"
+
+async def tagged_handler(request: web.Request) -> web.Response:
+    """Route answering with a header outside the CORS safelist"""
+    return web.Response(text="ok", headers={"X-Request-Id": "42"})
+
+@pytest.fixture
+async def client():
+    server = WebServer("http://mcp.invalid")
+    server.app.router.add_get("/test/tagged", tagged_handler)
+    async with TestClient(TestServer(server.app)) as client:
+        yield client
+
+async def test_preflight_is_answered_without_the_handler(client):
+    response = await client.options("/api/powerbi/query", headers={
+        "Origin": ORIGIN,
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "Content-Type"
+    })
+    
+    assert response.status == 200
+    assert response.headers["Access-Control-Allow-Origin"] == ORIGIN
+    assert response.headers["Access-Control-Allow-Methods"] == "POST"
+    assert response.headers["Access-Control-Allow-Headers"] == "Content-Type"
+    assert response.headers["Access-Control-Allow-Credentials"] == "true"
+
+async def test_non_safelisted_headers_are_exposed(client):
+    response = await client.get("/test/tagged", headers={"Origin": ORIGIN})
+    
+    assert response.status == 200
+    assert response.headers["Access-Control-Allow-Origin"] == ORIGIN
+    assert response.headers["Access-Control-Expose-Headers"] == "X-Request-Id"
+
+async def test_non_json_body_is_rejected_with_415(client):
+    response = await client.post("/api/powerbi/query", data="dax", headers={"Content-Type": "text/plain"})
+    
+    assert response.status == 415
+    assert (await response.json())["success"] is False
+
+async def test_oversized_body_is_rejected_with_413(client):
+    body = b"x" * (MAX_JSON_BODY_BYTES + 1)
+    response = await client.post("/api/powerbi/query", data=body, headers={"Content-Type": "application/json"})
+    
+    assert response.status == 413
+    assert (await response.json())["error"] == f"Request body exceeds {MAX_JSON_BODY_BYTES} bytes"
+
+async def test_oversized_chunked_body_is_rejected_with_413(client):
+    async def chunks():
+        for _ in range(MAX_JSON_BODY_BYTES // 65536 + 1):
+            yield b"x" * 65536
+    
+    # Without a Content-Length the limit is only hit while reading the body
+    response = await client.post("/api/powerbi/query", data=chunks(), headers={"Content-Type": "application/json"})
+    
+    assert response.status == 413
+    assert (await response.json())["error"] == f"Request body exceeds {MAX_JSON_BODY_BYTES} bytes"
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))